@@ -49,6 +49,11 @@ IMPLEMENTATION_PATTERNS = [
     r"component",
 ]
 
+# Each pattern family is only checked for presence, so fold it into one
+# alternation and scan the response once per family instead of once per pattern
+_TEST_RE = re.compile("|".join(TEST_PATTERNS), re.IGNORECASE)
+_IMPLEMENTATION_RE = re.compile("|".join(IMPLEMENTATION_PATTERNS), re.IGNORECASE)
+
 # Error patterns (two-stage filtering approach)
 # Stage 1: Exclude JSON field names containing "error"
 # Stage 2: Match actual error messages
@@ -64,6 +69,10 @@ ERROR_PATTERNS = [
     r"Fatal",
     r"FATAL",
 ]
+_ERROR_RES = tuple(re.compile(pattern, re.MULTILINE) for pattern in ERROR_PATTERNS)
+
+# JSON field names containing "error" (e.g. "is_error":), filtered out before counting
+_JSON_ERROR_FIELD_RE = re.compile(r'"[^"]*error[^"]*":', re.IGNORECASE)
 
 
 @dataclass
@@ -208,18 +217,12 @@ class ResponseAnalyzer:
                 work_summary = f"Detected: {keyword}"
                 break
 
-        # Count test patterns
-        test_count = sum(
-            1 for pattern in TEST_PATTERNS if re.search(pattern, response, re.IGNORECASE)
-        )
-
-        # Count implementation patterns
-        impl_count = sum(
-            1 for pattern in IMPLEMENTATION_PATTERNS if re.search(pattern, response, re.IGNORECASE)
-        )
+        # Check for test and implementation patterns
+        has_tests = _TEST_RE.search(response) is not None
+        has_implementation = _IMPLEMENTATION_RE.search(response) is not None
 
         # Determine if test-only
-        is_test_only = test_count > 0 and impl_count == 0
+        is_test_only = has_tests and not has_implementation
 
         # Get files modified from git
         files_modified = self._git_files_changed()
@@ -235,7 +238,7 @@ class ResponseAnalyzer:
         # Determine work type
         if is_test_only:
             work_type = WorkType.TESTING
-        elif impl_count > 0:
+        elif has_implementation:
             work_type = WorkType.IMPLEMENTATION
         else:
             work_type = WorkType.UNKNOWN
@@ -283,14 +286,8 @@ class ResponseAnalyzer:
         """Count error messages in response using two-stage filtering."""
         # Stage 1: Filter out JSON field patterns
         lines = response.split("\n")
-        filtered_lines = [
-            line for line in lines if not re.search(r'"[^"]*error[^"]*":', line, re.IGNORECASE)
-        ]
+        filtered_lines = [line for line in lines if not _JSON_ERROR_FIELD_RE.search(line)]
         filtered_text = "\n".join(filtered_lines)
 
         # Stage 2: Count actual error patterns
-        count = 0
-        for pattern in ERROR_PATTERNS:
-            count += len(re.findall(pattern, filtered_text, re.MULTILINE))
-
-        return count
+        return sum(len(pattern.findall(filtered_text)) for pattern in _ERROR_RES)
@@ -5,15 +5,20 @@ Manages sessions for LLM-powered PRD analysis and question flow.
 
 from __future__ import annotations
 
-import json
+import os
+import tempfile
+import threading
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from pydantic_core import from_json, to_json
 
-@dataclass
+
+@dataclass(slots=True)
 class ClarifySession:
     """State of an active clarify session.
 
@@ -23,7 +28,8 @@ class ClarifySession:
 
     id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
     topic: str = ""
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    # Creation time as epoch nanoseconds (stored as a plain int)
+    created_at_ns: int = field(default_factory=time.time_ns)
 
     # Mode: "create" for new PRD, "enhance" for improving existing
     mode: str = "create"
@@ -31,7 +37,7 @@ class ClarifySession:
     # Focus area for enhance mode (optional)
     focus: str | None = None
 
-    # Pending questions from LLM analysis
+    # Pending questions from LLM analysis (fixed for the session's lifetime)
     pending_questions: list[dict[str, Any]] = field(default_factory=list)
 
     # Current question index in pending_questions
@@ -43,6 +49,17 @@ class ClarifySession:
     # Status
     is_complete: bool = False
 
+    # Cached len(pending_questions)
+    _total_questions: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._total_questions = len(self.pending_questions)
+
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as an aware UTC datetime."""
+        return datetime.fromtimestamp(self.created_at_ns / 1e9, UTC)
+
     def current_question(self) -> dict[str, Any] | None:
         """Get the current question dict.
 
@@ -50,7 +67,7 @@ class ClarifySession:
             Question dict with 'question', 'options', 'context' keys,
             or None if no more questions.
         """
-        if self.current_question_index >= len(self.pending_questions):
+        if self.current_question_index >= self._total_questions:
             return None
         return self.pending_questions[self.current_question_index]
 
@@ -67,13 +84,7 @@ class ClarifySession:
         if question:
             self.answers[question["question"]] = answer
 
-        self.current_question_index += 1
-
-        if self.current_question_index >= len(self.pending_questions):
-            self.is_complete = True
-            return False
-
-        return True
+        return self._advance()
 
     def skip_question(self) -> bool:
         """Skip current question and advance.
@@ -81,9 +92,13 @@ class ClarifySession:
         Returns:
             True if there are more questions, False if complete.
         """
+        return self._advance()
+
+    def _advance(self) -> bool:
+        """Move to the next question, marking the session complete at the end."""
         self.current_question_index += 1
 
-        if self.current_question_index >= len(self.pending_questions):
+        if self.current_question_index >= self._total_questions:
             self.is_complete = True
             return False
 
@@ -91,44 +106,214 @@ class ClarifySession:
 
     def progress_text(self) -> str:
         """Get progress indicator text."""
-        total = len(self.pending_questions)
-        if total == 0:
-            return "0/0"
-        current = min(self.current_question_index + 1, total)
-        return f"{current}/{total}"
+        total = self._total_questions
+        return f"{min(self.current_question_index + 1, total)}/{total}"
 
     def has_questions(self) -> bool:
         """Check if there are pending questions."""
-        return len(self.pending_questions) > 0
+        return self._total_questions > 0
+
+
+@dataclass(slots=True)
+class _SessionLog:
+    """Replayed state of a session log file."""
+
+    index: dict[str, dict] = field(default_factory=dict)
+    records: int = 0
+    # (st_mtime_ns, st_size) of the file when the index was last in sync
+    signature: tuple[int, int] | None = None
+    # False until the first replay, or after another writer got in between
+    in_sync: bool = False
+    # The file ends in a torn record with no newline; the next append must
+    # start a new line or it would be glued onto the torn one
+    torn_tail: bool = False
+    # Handlers call the flow from worker threads; held while replaying,
+    # reading or appending to the index and while compacting
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+# Replayed logs shared by every ClarifyFlow in the process, keyed by path.
+# Handlers build a fresh ClarifyFlow per message, so this keeps the index hot.
+_session_logs: dict[Path, _SessionLog] = {}
+_session_logs_lock = threading.Lock()
+
+
+def _stat_signature(path: Path) -> tuple[int, int] | None:
+    """Return a cheap change marker for a file, or None if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _apply_record(index: dict[str, dict], record: dict[str, Any]) -> None:
+    """Apply a single ``put``/``del`` log record to an index."""
+    if record.get("op") == "put":
+        index[record["id"]] = record["data"]
+    elif record.get("op") == "del":
+        index.pop(record["id"], None)
 
 
 class ClarifyFlow:
-    """Manages clarify sessions and persistence."""
+    """Manages clarify sessions and persistence.
+
+    Sessions are stored as an append-only JSONL log of ``put``/``del``
+    records, replayed into an in-memory index that is shared across
+    instances in the process. Reads are served from the index after a
+    single stat confirms nobody else has touched the log. Each mutation
+    appends a single record instead of rewriting every session, and the
+    log is compacted once dead records outnumber live ones.
+    """
 
     def __init__(self, state_dir: Path | str = ".ralph"):
         self.state_dir = Path(state_dir)
-        self.sessions_file = self.state_dir / "clarify_sessions.json"
+        self.sessions_file = self.state_dir / "clarify_sessions.jsonl"
+        # Pre-JSONL store, migrated into the log on first replay
+        self.legacy_sessions_file = self.state_dir / "clarify_sessions.json"
 
     def _ensure_dir(self) -> None:
         """Ensure state directory exists."""
         self.state_dir.mkdir(parents=True, exist_ok=True)
 
-    def _load_sessions(self) -> dict[str, dict]:
-        """Load all sessions from file."""
-        if not self.sessions_file.exists():
-            return {}
-
+    def _log(self) -> _SessionLog:
+        """Return the shared log for this file, created on first use."""
+        with _session_logs_lock:
+            log = _session_logs.get(self.sessions_file)
+            if log is None:
+                log = _session_logs[self.sessions_file] = _SessionLog()
+            return log
+
+    def _sync(self, log: _SessionLog) -> None:
+        """Replay the log if the file changed. Caller holds ``log.lock``."""
+        signature = _stat_signature(self.sessions_file)
+        if not log.in_sync or log.signature != signature:
+            self._replay(log, signature)
+
+    def _replay(self, log: _SessionLog, signature: tuple[int, int] | None) -> None:
+        """Replay the log file into a fresh index. Caller holds ``log.lock``."""
+        if signature is None and self._migrate_legacy():
+            signature = _stat_signature(self.sessions_file)
+
+        index: dict[str, dict] = {}
+        records = 0
+        torn_tail = False
         try:
-            content = self.sessions_file.read_text()
-            return json.loads(content)
-        except (json.JSONDecodeError, OSError):
-            return {}
+            with self.sessions_file.open("rb") as f:
+                for line in f:
+                    torn_tail = not line.endswith(b"\n")
+                    try:
+                        record = from_json(line)
+                    except ValueError:
+                        # Torn write from an interrupted append
+                        continue
+                    records += 1
+                    _apply_record(index, record)
+        except OSError:
+            pass
+
+        log.index = index
+        log.records = records
+        log.signature = signature
+        log.in_sync = True
+        log.torn_tail = torn_tail
+
+    def _migrate_legacy(self) -> bool:
+        """Move sessions from the old single-JSON store into the log.
 
-    def _save_sessions(self, sessions: dict[str, dict]) -> None:
-        """Save all sessions to file."""
+        Returns:
+            True if a log was written from the legacy file
+        """
+        try:
+            legacy = from_json(self.legacy_sessions_file.read_bytes())
+        except OSError:
+            return False
+        except ValueError:
+            legacy = {}
+
+        lines = []
+        for sid, data in legacy.items() if isinstance(legacy, dict) else ():
+            try:
+                data = dict(data)
+                if "created_at_ns" not in data:
+                    created_at = datetime.fromisoformat(data.pop("created_at"))
+                    data["created_at_ns"] = int(created_at.timestamp() * 1e9)
+            except (KeyError, TypeError, ValueError):
+                continue
+            lines.append(to_json({"op": "put", "id": sid, "data": data}) + b"\n")
+
+        if lines:
+            fd, tmp_path = tempfile.mkstemp(dir=self.state_dir, suffix=".tmp")
+            try:
+                with open(fd, "wb") as f:
+                    f.write(b"".join(lines))
+                Path(tmp_path).replace(self.sessions_file)
+            except Exception:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        self.legacy_sessions_file.unlink(missing_ok=True)
+        return bool(lines)
+
+    def _append_record(self, record: dict[str, Any]) -> None:
+        """Append a single record to the session log."""
+        log = self._log()
+        with log.lock:
+            self._sync(log)
+            self._append_locked(log, record)
+
+    def _append_locked(self, log: _SessionLog, record: dict[str, Any]) -> None:
+        """Append a record and apply it to the index. Caller holds ``log.lock``."""
         self._ensure_dir()
-        content = json.dumps(sessions, indent=2, default=str)
-        self.sessions_file.write_text(content)
+        line = to_json(record) + b"\n"
+        if log.torn_tail:
+            line = b"\n" + line
+        # One write(2) on an O_APPEND fd so the record lands in a single append
+        fd = os.open(self.sessions_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+            st = os.fstat(fd)
+        finally:
+            os.close(fd)
+        _apply_record(log.index, record)
+        log.records += 1
+
+        # If the file grew by more than our record, another writer got in
+        # between; mark the index stale so the next access replays.
+        expected_size = (log.signature[1] if log.signature else 0) + len(line)
+        log.signature = (st.st_mtime_ns, st.st_size)
+        log.in_sync = st.st_size == expected_size
+        log.torn_tail = False
+        self._maybe_compact(log)
+
+    def _maybe_compact(self, log: _SessionLog) -> None:
+        """Rewrite the log with live sessions only once it is mostly dead records.
+
+        Caller holds ``log.lock``.
+        """
+        dead = log.records - len(log.index)
+        if dead * 2 <= log.records or not log.in_sync:
+            # Skip while another writer's appends are unaccounted for
+            return
+
+        content = b"".join(
+            to_json({"op": "put", "id": sid, "data": data}) + b"\n"
+            for sid, data in log.index.items()
+        )
+        fd, tmp_path = tempfile.mkstemp(dir=self.state_dir, suffix=".tmp")
+        try:
+            with open(fd, "wb") as f:
+                f.write(content)
+            if _stat_signature(self.sessions_file) != log.signature:
+                # Someone appended while we were writing; their record would
+                # be lost by the replace, so leave compaction for later
+                Path(tmp_path).unlink()
+                return
+            Path(tmp_path).replace(self.sessions_file)
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        log.records = len(log.index)
+        log.signature = _stat_signature(self.sessions_file)
 
     def create_session(
         self,
@@ -136,6 +321,7 @@ class ClarifyFlow:
         mode: str = "create",
         focus: str | None = None,
         pending_questions: list[dict[str, Any]] | None = None,
+        initial_answers: dict[str, str] | None = None,
     ) -> ClarifySession:
         """Create a new clarify session.
 
@@ -144,6 +330,8 @@ class ClarifyFlow:
             mode: "create" for new PRD, "enhance" for improving existing
             focus: Focus area for enhance mode
             pending_questions: Questions from LLM analysis
+            initial_answers: Answers to seed the session with, e.g. internal
+                "_"-prefixed values the handlers need when it completes
 
         Returns:
             New ClarifySession
@@ -153,54 +341,69 @@ class ClarifyFlow:
             mode=mode,
             focus=focus,
             pending_questions=pending_questions or [],
+            answers=dict(initial_answers) if initial_answers else {},
         )
 
         # Persist
         self._persist_session(session)
         return session
 
-    def _persist_session(self, session: ClarifySession) -> None:
-        """Persist a session to storage."""
-        sessions = self._load_sessions()
-        sessions[session.id] = {
+    def _session_to_dict(self, session: ClarifySession) -> dict:
+        """Convert session to dict for storage.
+
+        Mutable fields are copied so the stored snapshot never aliases
+        the live session object.
+        """
+        return {
             "id": session.id,
             "topic": session.topic,
-            "created_at": session.created_at.isoformat(),
+            "created_at_ns": session.created_at_ns,
             "mode": session.mode,
             "focus": session.focus,
-            "pending_questions": session.pending_questions,
+            "pending_questions": list(session.pending_questions),
             "current_question_index": session.current_question_index,
-            "answers": session.answers,
+            "answers": dict(session.answers),
             "is_complete": session.is_complete,
         }
-        self._save_sessions(sessions)
-
-    def get_session(self, session_id: str) -> ClarifySession | None:
-        """Get a session by ID."""
-        sessions = self._load_sessions()
-        data = sessions.get(session_id)
-        if not data:
-            return None
 
+    def _dict_to_session(self, data: dict) -> ClarifySession:
+        """Convert stored dict to session."""
         return ClarifySession(
             id=data["id"],
             topic=data["topic"],
-            created_at=datetime.fromisoformat(data["created_at"]),
+            created_at_ns=data["created_at_ns"],
             mode=data.get("mode", "create"),
             focus=data.get("focus"),
-            pending_questions=data.get("pending_questions", []),
+            pending_questions=list(data.get("pending_questions", [])),
             current_question_index=data.get("current_question_index", 0),
-            answers=data.get("answers", {}),
+            answers=dict(data.get("answers", {})),
             is_complete=data.get("is_complete", False),
         )
 
+    def _persist_session(self, session: ClarifySession) -> None:
+        """Persist a session to storage."""
+        data = self._session_to_dict(session)
+        self._append_record({"op": "put", "id": session.id, "data": data})
+
+    def get_session(self, session_id: str) -> ClarifySession | None:
+        """Get a session by ID."""
+        log = self._log()
+        with log.lock:
+            self._sync(log)
+            data = log.index.get(session_id)
+        if not data:
+            return None
+
+        return self._dict_to_session(data)
+
     def update_session(self, session: ClarifySession) -> None:
         """Update a session in storage."""
         self._persist_session(session)
 
     def delete_session(self, session_id: str) -> None:
         """Delete a session."""
-        sessions = self._load_sessions()
-        if session_id in sessions:
-            del sessions[session_id]
-            self._save_sessions(sessions)
+        log = self._log()
+        with log.lock:
+            self._sync(log)
+            if session_id in log.index:
+                self._append_locked(log, {"op": "del", "id": session_id})
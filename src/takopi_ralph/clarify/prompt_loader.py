@@ -7,11 +7,15 @@ All templates use .md format with {{variable}} syntax for substitution.
 from __future__ import annotations
 
 import re
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 
+# {{variable}} placeholders
+_VARIABLE_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+
 
 def load_prompt(name: str, **variables: Any) -> str:
     """Load prompt template and inject variables.
@@ -30,12 +34,17 @@ def load_prompt(name: str, **variables: Any) -> str:
         load_prompt("create", topic="My App", prd_json="{}")
         load_prompt("ralph_status", feedback_commands_section="...")
     """
+    return _render_template(_read_template(name), variables)
+
+
+@cache
+def _read_template(name: str) -> str:
+    """Read a bundled template once per process."""
     # Try .md first (standard), then .txt (legacy fallback)
     for ext in (".md", ".txt"):
         template_path = TEMPLATES_DIR / f"{name}{ext}"
         if template_path.exists():
-            template = template_path.read_text()
-            return _render_template(template, variables)
+            return template_path.read_text()
 
     raise FileNotFoundError(f"Template not found: {name}.txt or {name}.md in {TEMPLATES_DIR}")
 
@@ -56,13 +65,16 @@ def _render_template(template: str, variables: dict[str, Any]) -> str:
         return str(value)
 
     # Replace {{variable}} patterns
-    pattern = r"\{\{(\w+)\}\}"
-    return re.sub(pattern, replace_var, template)
+    return _VARIABLE_PATTERN.sub(replace_var, template)
 
 
+@lru_cache(maxsize=1)
 def get_system_prompt() -> str:
     """Load the shared system prompt with PRD schema injected.
 
+    The template ships with the package and takes no inputs, so it is
+    rendered once per process.
+
     Returns:
         System prompt string with schema information
     """
@@ -13,30 +13,25 @@ Examples:
 
 from __future__ import annotations
 
+import importlib
 import json
+import os
+from collections.abc import Awaitable, Callable
+from functools import cache, lru_cache
 from pathlib import Path
+from types import ModuleType
 from typing import TYPE_CHECKING, Any, cast
 
 from takopi.api import CommandContext, CommandResult, ConfigError, RunContext
 
+from ..init.flow import INIT_SESSIONS_FILE
 from .context import RalphContext
-from .handlers.clarify import (
+from .handlers.constants import (
     CLARIFY_CALLBACK_PREFIX,
-    handle_clarify_callback,
-    handle_clarify_response,
-    has_active_clarify_session,
-)
-from .handlers.init import (
+    CLARIFY_SESSION_FILE,
     INIT_CALLBACK_PREFIX,
-    handle_init,
-    handle_init_topic_input,
-    has_pending_init_session,
+    PRD_INIT_SESSIONS_FILE,
 )
-from .handlers.prd import handle_prd, handle_prd_init_input, has_pending_prd_init_session
-from .handlers.reset import handle_reset
-from .handlers.start import handle_start
-from .handlers.status import handle_status
-from .handlers.stop import handle_stop
 
 if TYPE_CHECKING:
     from takopi.api import TransportRuntime
@@ -71,6 +66,9 @@ RALPH_COMMANDS = frozenset({"init", "prd", "start", "status", "stop", "reset", "
 # Topic state filename (must match takopi's STATE_FILENAME)
 TOPIC_STATE_FILENAME = "telegram_topics_state.json"
 
+# Parsed topic state per file, keyed with the (mtime_ns, size) it was read at
+_topic_state_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
 def _read_topic_context(
     config_path: Path | None,
@@ -90,50 +88,82 @@ def _read_topic_context(
     if config_path is None or chat_id is None or thread_id is None:
         return None
 
-    state_path = config_path.with_name(TOPIC_STATE_FILENAME)
-    if not state_path.exists():
+    data = _load_topic_state(config_path.with_name(TOPIC_STATE_FILENAME))
+    if data is None:
         return None
 
-    try:
-        data = json.loads(state_path.read_text())
-        threads = data.get("threads", {})
-        thread_key = f"{chat_id}:{thread_id}"
-        thread = threads.get(thread_key)
-        if thread is None:
-            return None
+    threads = data.get("threads", {})
+    thread_key = f"{chat_id}:{thread_id}"
+    thread = threads.get(thread_key)
+    if thread is None:
+        return None
 
-        raw_context = thread.get("context")
-        if not isinstance(raw_context, dict):
-            return None
+    raw_context = thread.get("context")
+    if not isinstance(raw_context, dict):
+        return None
 
-        payload = cast(dict[str, Any], raw_context)
-        project = payload.get("project")
-        branch = payload.get("branch")
+    payload = cast(dict[str, Any], raw_context)
+    project = payload.get("project")
+    branch = payload.get("branch")
 
-        if project is not None and isinstance(project, str):
-            project = project.strip() or None
-        else:
-            project = None
+    project = project.strip() or None if project is not None and isinstance(project, str) else None
+    branch = branch.strip() or None if branch is not None and isinstance(branch, str) else None
 
-        branch = branch.strip() or None if branch is not None and isinstance(branch, str) else None
+    if project is None and branch is None:
+        return None
 
-        if project is None and branch is None:
-            return None
+    return RunContext(project=project, branch=branch)
 
-        return RunContext(project=project, branch=branch)
+
+def _load_topic_state(state_path: Path) -> dict[str, Any] | None:
+    """Load takopi's topic state file, reparsing only when it has changed.
+
+    Args:
+        state_path: Path to the topic state file
+
+    Returns:
+        Parsed state, or None if the file is missing or unreadable
+    """
+    try:
+        st = state_path.stat()
+    except OSError:
+        return None
+
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _topic_state_cache.get(state_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    try:
+        data = json.loads(state_path.read_text())
     except (json.JSONDecodeError, OSError):
         return None
+    if not isinstance(data, dict):
+        return None
+
+    _topic_state_cache[state_path] = (signature, data)
+    return data
+
+
+@lru_cache(maxsize=4)
+def _normalize_project_aliases(aliases: tuple[str, ...]) -> frozenset[str]:
+    """Lowercase project aliases for matching against command tokens.
+
+    takopi keys projects by lowercased alias but reports aliases as
+    configured, so they are normalized once per distinct alias list.
+    """
+    return frozenset(alias.lower() for alias in aliases)
 
 
 def _parse_project_branch(
     args: tuple[str, ...],
-    project_aliases: set[str],
+    project_aliases: frozenset[str],
 ) -> tuple[str | None, str | None, tuple[str, ...]]:
     """Parse project and @branch from command args.
 
     Args:
         args: Full command args including 'ralph'
-        project_aliases: Known project names from takopi config
+        project_aliases: Known project names from takopi config, lowercased
 
     Returns:
         (project, branch, remaining_args)
@@ -148,27 +178,26 @@ def _parse_project_branch(
     branch: str | None = None
 
     # Skip 'ralph' if present (depends on how takopi passes args)
-    remaining = list(args[1:]) if args and args[0].lower() == "ralph" else list(args)
+    consumed = 1 if args and args[0].lower() == "ralph" else 0
 
-    consumed = 0
-    for token in remaining:
+    for token in args[consumed:]:
         # @branch token
         if token.startswith("@") and len(token) > 1:
             branch = token[1:]
-            consumed += 1
-            continue
-
-        # Check if it's a known project (not a command)
-        lower = token.lower()
-        if lower in project_aliases and lower not in RALPH_COMMANDS:
+        else:
+            # Check if it's a known project (not a command)
+            lower = token.lower()
+            if lower not in project_aliases or lower in RALPH_COMMANDS:
+                # Hit a command or unknown token - stop parsing context
+                break
             project = lower
-            consumed += 1
-            continue
+        consumed += 1
 
-        # Hit a command or unknown token - stop parsing context
-        break
+        # Both slots filled - whatever follows is the command
+        if project is not None and branch is not None:
+            break
 
-    return project, branch, tuple(remaining[consumed:])
+    return project, branch, args[consumed:]
 
 
 def _resolve_ralph_context(
@@ -228,6 +257,72 @@ def _resolve_ralph_context(
     return RalphContext(run_context=run_ctx, cwd=resolved_path, args=remaining_args)
 
 
+# Files under .ralph/ that mean a flow is waiting for a text reply
+_SESSION_FILES = frozenset({PRD_INIT_SESSIONS_FILE, INIT_SESSIONS_FILE, CLARIFY_SESSION_FILE})
+
+
+def _session_files_present(cwd: Path) -> frozenset[str]:
+    """Return which session files exist, from a single scan of .ralph/.
+
+    Most messages arrive with no flow pending, so one directory read rules
+    out all of the per-flow checks at once.
+    """
+    try:
+        with os.scandir(cwd / ".ralph") as entries:
+            return frozenset(entry.name for entry in entries if entry.name in _SESSION_FILES)
+    except OSError:
+        return frozenset()
+
+
+@cache
+def _help_result() -> CommandResult:
+    """Build the help reply once; CommandResult is immutable so it is shared."""
+    return CommandResult(text=HELP_TEXT, extra={"parse_mode": "HTML"})
+
+
+async def _handle_help(
+    ctx: CommandContext,
+    ralph_ctx: RalphContext,
+) -> CommandResult | None:
+    """Handle /ralph help command."""
+    return _help_result()
+
+
+SubcommandHandler = Callable[[CommandContext, RalphContext], Awaitable[CommandResult | None]]
+
+
+def _handler_module(name: str) -> ModuleType:
+    """Import a handler module on first use.
+
+    The handlers pull in the LLM analyzer, clarify flow and PRD models, so
+    they are loaded when a message needs them rather than when takopi
+    loads the plugin. Later calls are a sys.modules lookup.
+    """
+    return importlib.import_module(f"{__package__}.handlers.{name}")
+
+
+def _lazy_handler(module: str, name: str) -> SubcommandHandler:
+    """Wrap a handler so its module is only imported when it is called."""
+
+    async def handler(ctx: CommandContext, ralph_ctx: RalphContext) -> CommandResult | None:
+        return await getattr(_handler_module(module), name)(ctx, ralph_ctx)
+
+    handler.__name__ = handler.__qualname__ = name
+    return handler
+
+
+# Subcommand name -> handler, each called as handler(ctx, ralph_ctx)
+SUBCOMMAND_HANDLERS: dict[str, SubcommandHandler] = {
+    "init": _lazy_handler("init", "handle_init"),
+    "prd": _lazy_handler("prd", "handle_prd"),
+    "start": _lazy_handler("start", "handle_start"),
+    "status": _lazy_handler("status", "handle_status"),
+    "stop": _lazy_handler("stop", "handle_stop"),
+    "reset": _lazy_handler("reset", "handle_reset"),
+    "help": _handle_help,
+}
+
+
 class RalphCommand:
     """Ralph command backend for takopi."""
 
@@ -245,13 +340,22 @@ class RalphCommand:
         if is_init_callback:
             return None
 
+        # Bare /ralph or /ralph help needs no project context, so answer
+        # before reading topic state or resolving the runtime
+        is_slash_command = ctx.text.startswith("/")
+        if is_slash_command:
+            args = ctx.args[1:] if ctx.args and ctx.args[0].lower() == "ralph" else ctx.args
+            if not args or (len(args) == 1 and args[0].lower() == "help"):
+                return _help_result()
+
         # Parse project/branch from args
-        project_aliases = set(ctx.runtime.project_aliases())
+        project_aliases = _normalize_project_aliases(ctx.runtime.project_aliases())
         project, branch, remaining_args = _parse_project_branch(ctx.args, project_aliases)
 
         # Get chat_id and thread_id for context lookup
-        chat_id = ctx.message.channel_id if ctx.message else None
-        thread_id = ctx.message.thread_id if ctx.message else None
+        message = ctx.message
+        chat_id = message.channel_id if message else None
+        thread_id = message.thread_id if message else None
 
         # Resolve to RalphContext
         try:
@@ -269,44 +373,43 @@ class RalphCommand:
 
         # Handle clarify callbacks (now that we have ralph_ctx with correct cwd)
         if is_clarify_callback:
-            parts = ctx.text.split(":")
-            if len(parts) >= 5:
-                session_id = parts[3]
-                answer = parts[4]
-                return await handle_clarify_callback(ctx, session_id, answer, ralph_ctx.cwd)
+            # ralph:prd:clarify:<session_id>:<answer>; the answer keeps any colons
+            callback_data = ctx.text[len(CLARIFY_CALLBACK_PREFIX) :]
+            session_id, sep, answer = callback_data.partition(":")
+            if sep:
+                clarify = _handler_module("clarify")
+                return await clarify.handle_clarify_callback(ctx, session_id, answer, ralph_ctx.cwd)
             return None
 
         # Check for pending sessions (using resolved cwd)
-        # Note: These check for text replies that don't start with /
-        if has_pending_prd_init_session(ralph_ctx.cwd) and not ctx.text.startswith("/"):
-            return await handle_prd_init_input(ctx, ctx.text, ralph_ctx)
-
-        if has_pending_init_session(ralph_ctx.cwd) and not ctx.text.startswith("/"):
-            return await handle_init_topic_input(ctx, ctx.text, ralph_ctx)
-
-        if has_active_clarify_session(ralph_ctx.cwd) and not ctx.text.startswith("/"):
-            return await handle_clarify_response(ctx, ctx.text, ralph_ctx.cwd)
+        # Only text replies can answer a session, so slash commands skip the lookups
+        if not is_slash_command:
+            cwd = ralph_ctx.cwd
+            session_files = _session_files_present(cwd)
+
+            if PRD_INIT_SESSIONS_FILE in session_files:
+                prd = _handler_module("prd")
+                if prd.has_pending_prd_init_session(cwd):
+                    return await prd.handle_prd_init_input(ctx, ctx.text, ralph_ctx)
+
+            if INIT_SESSIONS_FILE in session_files:
+                init = _handler_module("init")
+                if init.has_pending_init_session(cwd):
+                    return await init.handle_init_topic_input(ctx, ctx.text, ralph_ctx)
+
+            if CLARIFY_SESSION_FILE in session_files:
+                clarify = _handler_module("clarify")
+                if clarify.has_active_clarify_session(cwd):
+                    return await clarify.handle_clarify_response(ctx, ctx.text, cwd)
 
         # Get subcommand from remaining args
         subcommand = remaining_args[0].lower() if remaining_args else ""
 
         if not subcommand:
-            return CommandResult(text=HELP_TEXT, extra={"parse_mode": "HTML"})
+            return _help_result()
 
         # Route to handler with ralph_ctx
-        handlers = {
-            "init": handle_init,
-            "prd": handle_prd,
-            "start": handle_start,
-            "status": handle_status,
-            "stop": handle_stop,
-            "reset": handle_reset,
-            "help": lambda ctx, ralph_ctx: CommandResult(
-                text=HELP_TEXT, extra={"parse_mode": "HTML"}
-            ),
-        }
-
-        handler = handlers.get(subcommand)
+        handler = SUBCOMMAND_HANDLERS.get(subcommand)
         if handler is None:
             return CommandResult(
                 text=f"Unknown command: <code>{subcommand}</code>\n\n{HELP_TEXT}",
@@ -7,22 +7,23 @@ Users can either:
 
 from __future__ import annotations
 
-import json
+import os
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+import anyio
+from pydantic_core import from_json, to_json
 from takopi.api import CommandContext, CommandResult
 from takopi.transport import RenderedMessage
 
 from ...clarify import ClarifyFlow, ClarifySession
 from ...clarify.llm_analyzer import LLMAnalyzer
 from ...prd import PRD, PRDManager
+from .constants import CLARIFY_CALLBACK_PREFIX, CLARIFY_SESSION_FILE
 
-# Callback data prefix for clarify responses
-CLARIFY_CALLBACK_PREFIX = "ralph:prd:clarify:"
-
-# Session file for tracking active clarify sessions
-CLARIFY_SESSION_FILE = "clarify_session.json"
+# Active session ID per session file, keyed with the (mtime_ns, size) it was read at
+_active_sessions: dict[Path, tuple[tuple[int, int], str | None]] = {}
 
 
 def _get_session_file(cwd: Path) -> Path:
@@ -32,42 +33,58 @@ def _get_session_file(cwd: Path) -> Path:
 
 def has_active_clarify_session(cwd: Path) -> bool:
     """Check if there's an active clarify session waiting for input."""
-    session_file = _get_session_file(cwd)
-    if not session_file.exists():
-        return False
-
-    try:
-        data = json.loads(session_file.read_text())
-        return bool(data.get("session_id"))
-    except (json.JSONDecodeError, OSError):
-        return False
+    return _get_active_session_id(cwd) is not None
 
 
 def _save_active_session(cwd: Path, session_id: str) -> None:
     """Save the active clarify session ID."""
     session_file = _get_session_file(cwd)
     session_file.parent.mkdir(parents=True, exist_ok=True)
-    session_file.write_text(json.dumps({"session_id": session_id}))
+    session_file.write_bytes(to_json({"session_id": session_id}))
+    _remember_active_session(session_file, session_id)
 
 
 def _get_active_session_id(cwd: Path) -> str | None:
-    """Get the active clarify session ID."""
+    """Get the active clarify session ID.
+
+    Every plain-text message in a chat asks this, so the parsed file is
+    cached and a single stat decides whether it needs reading again.
+    """
     session_file = _get_session_file(cwd)
-    if not session_file.exists():
+    try:
+        st = os.stat(session_file)
+    except OSError:
         return None
 
+    cached = _active_sessions.get(session_file)
+    if cached is not None and cached[0] == (st.st_mtime_ns, st.st_size):
+        return cached[1]
+
     try:
-        data = json.loads(session_file.read_text())
-        return data.get("session_id")
-    except (json.JSONDecodeError, OSError):
+        data = from_json(session_file.read_bytes())
+        session_id = data.get("session_id") or None
+    except (ValueError, OSError):
         return None
 
+    _active_sessions[session_file] = ((st.st_mtime_ns, st.st_size), session_id)
+    return session_id
+
+
+def _remember_active_session(session_file: Path, session_id: str | None) -> None:
+    """Record what this process just wrote, so the next read skips the file."""
+    try:
+        st = os.stat(session_file)
+    except OSError:
+        _active_sessions.pop(session_file, None)
+        return
+    _active_sessions[session_file] = ((st.st_mtime_ns, st.st_size), session_id)
+
 
 def _clear_active_session(cwd: Path) -> None:
     """Clear the active clarify session."""
     session_file = _get_session_file(cwd)
-    if session_file.exists():
-        session_file.unlink()
+    session_file.unlink(missing_ok=True)
+    _active_sessions.pop(session_file, None)
 
 
 def _build_keyboard(session_id: str, options: list[str]) -> dict[str, Any]:
@@ -80,30 +97,21 @@ def _build_keyboard(session_id: str, options: list[str]) -> dict[str, Any]:
     Returns:
         Telegram reply_markup dict with inline_keyboard
     """
-    buttons = []
-
-    # Add numbered option buttons (one per row)
-    for i, option in enumerate(options):
-        # Truncate long options for button text
-        label = option if len(option) <= 40 else option[:37] + "..."
-        buttons.append(
-            [
-                {
-                    "text": f"{i + 1}. {label}",
-                    "callback_data": f"{CLARIFY_CALLBACK_PREFIX}{session_id}:{i}",
-                }
-            ]
-        )
+    callback_base = f"{CLARIFY_CALLBACK_PREFIX}{session_id}:"
 
-    # Add skip button
-    buttons.append(
+    # Numbered option buttons (one per row), long options truncated for the label
+    buttons = [
         [
             {
-                "text": "Skip this question",
-                "callback_data": f"{CLARIFY_CALLBACK_PREFIX}{session_id}:skip",
+                "text": f"{i}. {option if len(option) <= 40 else option[:37] + '...'}",
+                "callback_data": f"{callback_base}{i - 1}",
             }
         ]
-    )
+        for i, option in enumerate(options, start=1)
+    ]
+
+    # Add skip button
+    buttons.append([{"text": "Skip this question", "callback_data": f"{callback_base}skip"}])
 
     return {"inline_keyboard": buttons}
 
@@ -112,10 +120,13 @@ async def send_question(
     ctx: CommandContext,
     session: ClarifySession,
     cwd: Path,
+    intro: str | None = None,
 ) -> None:
     """Send the current question with inline keyboard buttons.
 
     Also accepts text replies as fallback (number, 'skip', or custom text).
+    An HTML intro, if given, leads the same message rather than costing
+    a separate send.
     """
     question = session.current_question()
     if not question:
@@ -127,7 +138,8 @@ async def send_question(
     context = question.get("context", "")
 
     # Use HTML format for Telegram compatibility
-    lines = [f"<b>[{progress}] {question_text}</b>"]
+    lines = [intro, ""] if intro else []
+    lines.append(f"<b>[{progress}] {question_text}</b>")
 
     if context:
         lines.append(f"\n<i>{context}</i>")
@@ -147,7 +159,7 @@ async def send_question(
     await ctx.executor.send(message)
 
     # Track this as the active session (for text reply fallback)
-    _save_active_session(cwd, session.id)
+    await anyio.to_thread.run_sync(_save_active_session, cwd, session.id)
 
 
 async def handle_clarify_response(
@@ -172,13 +184,13 @@ async def handle_clarify_response(
     prd_manager = PRDManager(cwd / "prd.json")
 
     # Get active session
-    session_id = _get_active_session_id(cwd)
+    session_id = await anyio.to_thread.run_sync(_get_active_session_id, cwd)
     if not session_id:
         return None  # No active session
 
-    session = flow.get_session(session_id)
+    session = await anyio.to_thread.run_sync(flow.get_session, session_id)
     if not session:
-        _clear_active_session(cwd)
+        await anyio.to_thread.run_sync(_clear_active_session, cwd)
         return CommandResult(
             text="Session expired. Start a new <code>/ralph prd clarify</code>.",
             extra={"parse_mode": "HTML"},
@@ -211,8 +223,8 @@ async def handle_clarify_response(
             has_more = session.record_answer(response_text.strip())
             await ctx.executor.send(f"Got it: {response_text.strip()}")
 
-    # Update session
-    flow.update_session(session)
+    # Update session (may compact the session log)
+    await anyio.to_thread.run_sync(flow.update_session, session)
 
     if has_more:
         # Send next question
@@ -220,7 +232,7 @@ async def handle_clarify_response(
         return None
     else:
         # Clear active session before completing
-        _clear_active_session(cwd)
+        await anyio.to_thread.run_sync(_clear_active_session, cwd)
         # Session complete - use LLM to generate/enhance PRD with answers
         return await _complete_session(ctx, session, flow, prd_manager, cwd)
 
@@ -248,9 +260,9 @@ async def handle_clarify_callback(
     prd_manager = PRDManager(cwd / "prd.json")
 
     # Get session
-    session = flow.get_session(session_id)
+    session = await anyio.to_thread.run_sync(flow.get_session, session_id)
     if not session:
-        _clear_active_session(cwd)
+        await anyio.to_thread.run_sync(_clear_active_session, cwd)
         return CommandResult(
             text="Session expired. Start a new <code>/ralph prd clarify</code>.",
             extra={"parse_mode": "HTML"},
@@ -276,8 +288,8 @@ async def handle_clarify_callback(
         except ValueError:
             has_more = session.skip_question()
 
-    # Update session
-    flow.update_session(session)
+    # Update session (may compact the session log)
+    await anyio.to_thread.run_sync(flow.update_session, session)
 
     if has_more:
         # Send next question
@@ -285,11 +297,18 @@ async def handle_clarify_callback(
         return None
     else:
         # Clear active session before completing
-        _clear_active_session(cwd)
+        await anyio.to_thread.run_sync(_clear_active_session, cwd)
         # Session complete - use LLM to generate/enhance PRD with answers
         return await _complete_session(ctx, session, flow, prd_manager, cwd)
 
 
+def _load_existing_prd(prd_manager: PRDManager) -> PRD | None:
+    """Load the PRD being enhanced, or None if there is no prd.json."""
+    if not prd_manager.exists():
+        return None
+    return prd_manager.load()
+
+
 async def _complete_session(
     ctx: CommandContext,
     session: ClarifySession,
@@ -304,9 +323,10 @@ async def _complete_session(
     await ctx.executor.send("Generating stories from your answers...")
 
     # Load or create PRD
-    if session.mode == "enhance" and prd_manager.exists():
-        prd = prd_manager.load()
-    else:
+    prd = None
+    if session.mode == "enhance":
+        prd = await anyio.to_thread.run_sync(_load_existing_prd, prd_manager)
+    if prd is None:
         # Create mode - get project info from session
         topic = session.topic
         description = session.answers.pop("_description", "")
@@ -331,21 +351,23 @@ async def _complete_session(
     existing_titles = {s.title.lower() for s in prd.stories}
 
     for story in result.suggested_stories:
-        if story.title.lower() not in existing_titles:
-            prd.add_story(
-                title=story.title,
-                description=story.description,
-                acceptance_criteria=story.acceptance_criteria,
-                priority=story.priority,
-            )
-            existing_titles.add(story.title.lower())
-            added_count += 1
+        title_key = story.title.lower()
+        if title_key in existing_titles:
+            continue
+        prd.add_story(
+            title=story.title,
+            description=story.description,
+            acceptance_criteria=story.acceptance_criteria,
+            priority=story.priority,
+        )
+        existing_titles.add(title_key)
+        added_count += 1
 
     # Save PRD
-    prd_manager.save(prd)
+    await anyio.to_thread.run_sync(prd_manager.save, prd)
 
     # Clean up session
-    flow.delete_session(session.id)
+    await anyio.to_thread.run_sync(flow.delete_session, session.id)
 
     # Build response (plain text - no markdown issues)
     if session.mode == "enhance":
@@ -369,7 +391,7 @@ async def _complete_session(
             )
     else:
         # Create mode
-        stories_text = "\n".join(f"  {s.id}. {s.title}" for s in prd.stories[:5])
+        stories_text = "\n".join(f"  {s.id}. {s.title}" for s in islice(prd.stories, 5))
         if len(prd.stories) > 5:
             stories_text += f"\n  ... and {len(prd.stories) - 5} more"
 
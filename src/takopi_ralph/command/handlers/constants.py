@@ -0,0 +1,19 @@
+"""Callback prefixes and session filenames shared by the handlers and the backend.
+
+Kept free of handler imports so the backend can route messages without
+loading every handler module.
+"""
+
+from __future__ import annotations
+
+# Callback data prefix for clarify responses
+CLARIFY_CALLBACK_PREFIX = "ralph:prd:clarify:"
+
+# Callback data prefix for init responses
+INIT_CALLBACK_PREFIX = "ralph:init:"
+
+# Session file for tracking active clarify sessions
+CLARIFY_SESSION_FILE = "clarify_session.json"
+
+# Session storage filename for prd init
+PRD_INIT_SESSIONS_FILE = "prd_init_sessions.json"
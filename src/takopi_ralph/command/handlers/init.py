@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+from functools import partial
+from html import escape
+from itertools import islice
 from pathlib import Path
 
+import anyio
 from takopi.api import CommandContext, CommandResult
 
 from ...clarify import ClarifyFlow
@@ -14,8 +18,24 @@ from ...state import StateManager
 from ..context import RalphContext
 from .clarify import send_question
 
-# Callback data prefix for init responses
-INIT_CALLBACK_PREFIX = "ralph:init:"
+
+def _probe_project(cwd: Path) -> tuple[PRD | None, list[str], bool]:
+    """Read the PRD and loop state that decide whether init can start.
+
+    Args:
+        cwd: Project working directory
+
+    Returns:
+        (prd, errors, loop_running). prd is set only for a valid prd.json and
+        errors only for an invalid one; the loop is only checked without one.
+    """
+    prd_manager = PRDManager(cwd / "prd.json")
+    if prd_manager.exists():
+        prd, errors = prd_manager.load_validated()
+        return prd, errors, False
+
+    state_manager = StateManager(cwd / ".ralph")
+    return None, [], state_manager.exists() and state_manager.is_running()
 
 
 async def handle_init(
@@ -34,24 +54,22 @@ async def handle_init(
     """
     cwd = ralph_ctx.cwd
 
-    # Check if already initialized with PRD
-    prd_manager = PRDManager(cwd / "prd.json")
-    if prd_manager.exists():
-        # Validate PRD to give more helpful message
-        is_valid, errors = prd_manager.validate()
-        prd = prd_manager.load()
-        label = ralph_ctx.context_label()
-
-        if not is_valid:
-            error_lines = "\n".join(f"  • {e}" for e in errors[:3])
-            return CommandResult(
-                text=f"Project <b>{label}</b> has a <code>prd.json</code> "
-                f"but it has validation errors:\n{error_lines}\n\n"
-                "Run <code>/ralph prd fix</code> to auto-fix, or "
-                "<code>/ralph prd show</code> to view raw JSON.",
-                extra={"parse_mode": "HTML"},
-            )
+    # Check PRD and loop state in one worker thread, off the event loop
+    prd, errors, loop_running = await anyio.to_thread.run_sync(_probe_project, cwd)
+    label = ralph_ctx.context_label()
 
+    if errors:
+        # Validation failed - give a more helpful message
+        error_lines = "\n".join(f"  • {escape(e)}" for e in errors[:3])
+        return CommandResult(
+            text=f"Project <b>{label}</b> has a <code>prd.json</code> "
+            f"but it has validation errors:\n{error_lines}\n\n"
+            "Run <code>/ralph prd fix</code> to auto-fix, or "
+            "<code>/ralph prd show</code> to view raw JSON.",
+            extra={"parse_mode": "HTML"},
+        )
+
+    if prd is not None:
         return CommandResult(
             text=f"Project already initialized in <b>{label}</b>: <b>{prd.project_name}</b>\n"
             f"Progress: {prd.progress_summary()}\n\n"
@@ -62,9 +80,7 @@ async def handle_init(
             extra={"parse_mode": "HTML"},
         )
 
-    # Check if loop is running
-    state_manager = StateManager(cwd / ".ralph")
-    if state_manager.exists() and state_manager.is_running():
+    if loop_running:
         return CommandResult(
             text="A Ralph loop is currently running.\n"
             "Use <code>/ralph stop</code> first, then run <code>/ralph init</code>.",
@@ -110,7 +126,7 @@ async def handle_init_topic_input(
     init_flow = InitFlow(cwd / ".ralph")
 
     # Get pending session
-    session = init_flow.get_pending_session()
+    session = await anyio.to_thread.run_sync(init_flow.get_pending_session)
     if not session:
         return None  # No pending session, ignore
 
@@ -124,75 +140,74 @@ async def handle_init_topic_input(
     session.git_available = checks["git_available"]
     session.ralph_dir_exists = checks["ralph_dir_exists"]
 
-    init_flow.update_session(session)
-
     # Collect warnings
     warnings = []
     if not session.git_available:
         warnings.append("No git repository detected. Consider running `git init`.")
 
-    # Create .ralph directory
-    (cwd / ".ralph").mkdir(parents=True, exist_ok=True)
-
     # Build intro message
     warning_text = ""
     if warnings:
         warning_text = "\n".join(f"• {w}" for w in warnings)
         warning_text = f"\n<b>Warnings:</b>\n{warning_text}\n"
 
-    await ctx.executor.send(
-        f"Initializing project: <b>{session.topic}</b>\n"
-        f"{warning_text}\n"
-        "Analyzing your project to generate relevant questions...",
-        extra={"parse_mode": "HTML"},
-    )
+    async def save_and_announce() -> None:
+        # Saving the session also creates .ralph/
+        await anyio.to_thread.run_sync(init_flow.update_session, session)
+        await ctx.executor.send(
+            f"Initializing project: <b>{session.topic}</b>\n"
+            f"{warning_text}\n"
+            "Analyzing your project to generate relevant questions...",
+            extra={"parse_mode": "HTML"},
+        )
 
-    # Use LLM to generate questions for this project
+    # Use LLM to generate questions for this project; the analysis takes
+    # seconds, so the session write and intro message run alongside it
     empty_prd = PRD(project_name=session.topic, description=topic)
     analyzer = LLMAnalyzer(ctx.executor, cwd=cwd)
 
-    result = await analyzer.analyze(
-        prd_json=empty_prd.model_dump_json(),
-        mode="create",
-        topic=session.topic,
-        description=topic,
-    )
+    try:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(save_and_announce)
+            result = await analyzer.analyze(
+                prd_json=empty_prd.model_dump_json(),
+                mode="create",
+                topic=session.topic,
+                description=topic,
+            )
+    except* Exception as group:
+        # Surface the underlying error; takopi only shows str(exc) to the user
+        raise group.exceptions[0] from None
 
     # Create clarify session with LLM-generated questions
     clarify_flow = ClarifyFlow(cwd / ".ralph")
 
     if result.questions:
-        pending_questions = [
-            {
-                "question": q.question,
-                "options": q.options,
-                "context": q.context,
-            }
-            for q in result.questions
-        ]
-
-        clarify_session = clarify_flow.create_session(
-            topic=session.topic,
-            mode="create",
-            pending_questions=pending_questions,
+        pending_questions = [q.model_dump() for q in result.questions]
+
+        clarify_session = await anyio.to_thread.run_sync(
+            partial(
+                clarify_flow.create_session,
+                topic=session.topic,
+                mode="create",
+                pending_questions=pending_questions,
+                # Description is kept for later PRD creation
+                initial_answers={"_description": topic},
+            )
         )
 
-        # Store description for later PRD creation
-        clarify_session.answers["_description"] = topic
-        clarify_flow.update_session(clarify_session)
-
         session.clarify_session_id = clarify_session.id
         session.phase = InitPhase.CLARIFYING
-        init_flow.update_session(session)
-
-        await ctx.executor.send(
-            f"<b>{result.analysis}</b>\n\n"
+        await anyio.to_thread.run_sync(init_flow.update_session, session)
+
+        # Send first clarify question, introduced by the analysis
+        await send_question(
+            ctx,
+            clarify_session,
+            cwd,
+            intro=f"<b>{result.analysis}</b>\n\n"
             f"I have {len(result.questions)} questions to help create your PRD.",
-            extra={"parse_mode": "HTML"},
         )
-
-        # Send first clarify question
-        await send_question(ctx, clarify_session)
         return None
 
     # No questions needed - create PRD directly
@@ -216,12 +231,12 @@ async def handle_init_topic_input(
             priority=1,
         )
 
-    prd_manager.save(empty_prd)
+    await anyio.to_thread.run_sync(prd_manager.save, empty_prd)
 
     # Clean up init session
-    init_flow.delete_session(session.id)
+    await anyio.to_thread.run_sync(init_flow.delete_session, session.id)
 
-    stories_text = "\n".join(f"  {s.id}. {s.title}" for s in empty_prd.stories[:5])
+    stories_text = "\n".join(f"  {s.id}. {s.title}" for s in islice(empty_prd.stories, 5))
     if len(empty_prd.stories) > 5:
         stories_text += f"\n  ... and {len(empty_prd.stories) - 5} more"
 
@@ -3,8 +3,16 @@
 from __future__ import annotations
 
 import json
+import re
+import tempfile
+from collections.abc import Awaitable, Callable
+from functools import partial
+from html import escape
+from itertools import islice
 from pathlib import Path
 
+import anyio
+from pydantic_core import from_json
 from takopi.api import CommandContext, CommandResult, RunRequest
 
 from ...clarify import ClarifyFlow
@@ -12,9 +20,19 @@ from ...clarify.llm_analyzer import LLMAnalyzer
 from ...prd import PRD, PRDManager
 from ..context import RalphContext
 from .clarify import send_question
+from .constants import PRD_INIT_SESSIONS_FILE
 
-# Session storage filename for prd init
-PRD_INIT_SESSIONS_FILE = "prd_init_sessions.json"
+# Contents of a pending prd init session file; the payload never varies
+_PENDING_SESSION = b'{"pending":true}'
+
+# Phrases that usually carry the project name, tried in order
+_PROJECT_NAME_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:building|create|develop|make|implement)\s+(?:a|an|the)?\s*([A-Za-z0-9\s]+?)(?:\.|,|that|which|with|for)",
+        r"^(?:a|an|the)?\s*([A-Za-z0-9\s]+?)(?:\.|,|that|which|with|for|-)",
+    )
+)
 
 # Prompt for LLM to fix invalid PRD
 PRD_FIX_PROMPT = """The prd.json file has validation errors and needs to be converted to Ralph's \
@@ -91,22 +109,13 @@ async def handle_prd(
     """
     # Args from ralph_ctx already have project/branch stripped
     # e.g. ("prd",) or ("prd", "clarify")
-    args = ralph_ctx.args[1:] if len(ralph_ctx.args) > 1 else []
-
-    if not args:
+    if len(ralph_ctx.args) < 2:
         return await handle_prd_status(ctx, ralph_ctx)
 
-    subcommand = args[0].lower()
+    subcommand = ralph_ctx.args[1].lower()
 
-    if subcommand == "init":
-        return await handle_prd_init(ctx, ralph_ctx)
-    elif subcommand == "clarify":
-        return await handle_prd_clarify(ctx, ralph_ctx)
-    elif subcommand == "fix":
-        return await handle_prd_fix(ctx, ralph_ctx)
-    elif subcommand == "show":
-        return await handle_prd_show(ctx, ralph_ctx)
-    else:
+    handler = PRD_SUBCOMMAND_HANDLERS.get(subcommand)
+    if handler is None:
         return CommandResult(
             text=f"Unknown prd subcommand: <code>{subcommand}</code>\n\n"
             "<b>Usage:</b>\n"
@@ -118,6 +127,8 @@ async def handle_prd(
             extra={"parse_mode": "HTML"},
         )
 
+    return await handler(ctx, ralph_ctx)
+
 
 async def handle_prd_status(
     ctx: CommandContext,
@@ -136,9 +147,9 @@ async def handle_prd_status(
         )
 
     # Validate PRD schema
-    is_valid, errors = prd_manager.validate()
-    if not is_valid:
-        errors_text = "\n".join(f"  • {e}" for e in errors[:5])
+    prd, errors = prd_manager.load_validated()
+    if prd is None:
+        errors_text = "\n".join(f"  • {escape(e)}" for e in errors[:5])
         if len(errors) > 5:
             errors_text += f"\n  ... and {len(errors) - 5} more"
 
@@ -152,9 +163,14 @@ async def handle_prd_status(
             extra={"parse_mode": "HTML"},
         )
 
-    prd = prd_manager.load()
+    return CommandResult(text=_format_prd_status(prd), extra={"parse_mode": "HTML"})
+
 
-    # Build status display
+def _format_prd_status(prd: PRD) -> str:
+    """Format the PRD status display.
+
+    The story list and completed count come from one pass over the stories.
+    """
     lines = [
         f"<b>{prd.project_name}</b>",
         "",
@@ -163,26 +179,28 @@ async def handle_prd_status(
     if prd.description:
         # Truncate long descriptions
         desc = prd.description[:200] + "..." if len(prd.description) > 200 else prd.description
-        lines.append(f"<i>{desc}</i>")
-        lines.append("")
+        lines += [f"<i>{desc}</i>", ""]
+
+    story_lines = []
+    completed = 0
+    for story in prd.stories:
+        if story.passes:
+            completed += 1
+        story_lines.append(f"  {'✓' if story.passes else '○'} {story.id}. {story.title}")
 
-    lines.append(f"<b>Progress:</b> {prd.completed_count()}/{prd.total_count()} stories complete")
-    lines.append("")
+    lines += [f"<b>Progress:</b> {completed}/{len(prd.stories)} stories complete", ""]
 
     # Story list with status indicators
-    if prd.stories:
+    if story_lines:
         lines.append("<b>Stories:</b>")
-        for story in prd.stories:
-            status_icon = "✓" if story.passes else "○"
-            lines.append(f"  {status_icon} {story.id}. {story.title}")
+        lines += story_lines
 
     # Next story hint
     next_story = prd.next_story()
     if next_story:
-        lines.append("")
-        lines.append(f"<b>Next:</b> {next_story.title}")
+        lines += ["", f"<b>Next:</b> {next_story.title}"]
 
-    return CommandResult(text="\n".join(lines), extra={"parse_mode": "HTML"})
+    return "\n".join(lines)
 
 
 async def handle_prd_init(
@@ -206,11 +224,8 @@ async def handle_prd_init(
             extra={"parse_mode": "HTML"},
         )
 
-    # Ensure .ralph directory exists
-    (cwd / ".ralph").mkdir(parents=True, exist_ok=True)
-
-    # Create pending session
-    _create_prd_init_session(cwd)
+    # Create pending session (this also creates .ralph/)
+    await anyio.to_thread.run_sync(_create_prd_init_session, cwd)
 
     await ctx.executor.send(
         "<b>Create Initial PRD</b>\n\n"
@@ -242,7 +257,7 @@ async def handle_prd_init_input(
     flow = ClarifyFlow(cwd / ".ralph")
 
     # Clear the pending session
-    _delete_prd_init_session(cwd)
+    await anyio.to_thread.run_sync(_delete_prd_init_session, cwd)
 
     # Create empty PRD with project name extracted from description
     project_name = _extract_project_name(description)
@@ -265,31 +280,26 @@ async def handle_prd_init_input(
     # If LLM has questions, start clarify flow
     if result.questions:
         # Convert questions to session format
-        pending_questions = [
-            {
-                "question": q.question,
-                "options": q.options,
-                "context": q.context,
-            }
-            for q in result.questions
-        ]
-
-        session = flow.create_session(
-            topic=project_name,
-            mode="create",
-            pending_questions=pending_questions,
+        pending_questions = [q.model_dump() for q in result.questions]
+
+        session = await anyio.to_thread.run_sync(
+            partial(
+                flow.create_session,
+                topic=project_name,
+                mode="create",
+                pending_questions=pending_questions,
+                # Description is kept for later PRD creation
+                initial_answers={"_description": description},
+            )
         )
 
-        # Store description in session for later use
-        session.answers["_description"] = description
-        flow.update_session(session)
-
         # Note: Claude already outputs analysis, just show question count
-        await ctx.executor.send(
-            f"I have {len(result.questions)} questions to help create your PRD."
+        await send_question(
+            ctx,
+            session,
+            cwd,
+            intro=f"I have {len(result.questions)} questions to help create your PRD.",
         )
-
-        await send_question(ctx, session, cwd)
         return None
 
     # No questions - generate PRD directly from stories
@@ -302,9 +312,9 @@ async def handle_prd_init_input(
                 priority=story.priority,
             )
 
-        prd_manager.save(empty_prd)
+        await anyio.to_thread.run_sync(prd_manager.save, empty_prd)
 
-        stories_text = "\n".join(f"  {s.id}. {s.title}" for s in empty_prd.stories[:5])
+        stories_text = "\n".join(f"  {s.id}. {s.title}" for s in islice(empty_prd.stories, 5))
         if len(empty_prd.stories) > 5:
             stories_text += f"\n  ... and {len(empty_prd.stories) - 5} more"
 
@@ -325,7 +335,7 @@ async def handle_prd_init_input(
         acceptance_criteria=["Project scaffolded", "Dependencies installed"],
         priority=1,
     )
-    prd_manager.save(empty_prd)
+    await anyio.to_thread.run_sync(prd_manager.save, empty_prd)
 
     return CommandResult(
         text=f"<b>PRD created for {project_name}</b>\n\n"
@@ -352,15 +362,14 @@ async def handle_prd_clarify(
             extra={"parse_mode": "HTML"},
         )
 
-    prd = prd_manager.load()
+    prd = await anyio.to_thread.run_sync(prd_manager.load)
 
     # Ensure .ralph directory exists
     (cwd / ".ralph").mkdir(parents=True, exist_ok=True)
 
     # Check for focus text: /ralph prd clarify <focus>
     # ralph_ctx.args = ("prd", "clarify", ...) after project/branch stripped
-    focus_args = ralph_ctx.args[2:] if len(ralph_ctx.args) > 2 else []
-    focus = " ".join(focus_args) if focus_args else None
+    focus = " ".join(ralph_ctx.args[2:]) or None
 
     # Initialize flow manager
     flow = ClarifyFlow(cwd / ".ralph")
@@ -381,28 +390,25 @@ async def handle_prd_clarify(
 
     # If LLM has questions, start clarify flow
     if result.questions:
-        pending_questions = [
-            {
-                "question": q.question,
-                "options": q.options,
-                "context": q.context,
-            }
-            for q in result.questions
-        ]
-
-        session = flow.create_session(
-            topic=prd.project_name,
-            mode="enhance",
-            focus=focus,
-            pending_questions=pending_questions,
+        pending_questions = [q.model_dump() for q in result.questions]
+
+        session = await anyio.to_thread.run_sync(
+            partial(
+                flow.create_session,
+                topic=prd.project_name,
+                mode="enhance",
+                focus=focus,
+                pending_questions=pending_questions,
+            )
         )
 
         # Note: Claude already outputs analysis, just show question count
-        await ctx.executor.send(
-            f"I have {len(result.questions)} questions to improve the PRD."
+        await send_question(
+            ctx,
+            session,
+            cwd,
+            intro=f"I have {len(result.questions)} questions to improve the PRD.",
         )
-
-        await send_question(ctx, session, cwd)
         return None
 
     # No questions - apply suggested stories directly
@@ -421,7 +427,7 @@ async def handle_prd_clarify(
                 added_count += 1
 
         if added_count > 0:
-            prd_manager.save(prd)
+            await anyio.to_thread.run_sync(prd_manager.save, prd)
             return CommandResult(
                 text=f"<b>PRD Enhanced</b>\n\n"
                 f"{result.analysis}\n\n"
@@ -500,9 +506,8 @@ async def handle_prd_fix(
     )
 
     # Re-validate after fix
-    is_valid, errors = prd_manager.validate()
-    if is_valid:
-        prd = prd_manager.load()
+    prd, errors = prd_manager.load_validated()
+    if prd is not None:
         return CommandResult(
             text=f"<b>PRD fixed!</b>\n\n"
             f"Project: {prd.project_name}\n"
@@ -511,7 +516,7 @@ async def handle_prd_fix(
             extra={"parse_mode": "HTML"},
         )
     else:
-        errors_text = "\n".join(f"  • {e}" for e in errors[:3])
+        errors_text = "\n".join(f"  • {escape(e)}" for e in errors[:3])
         return CommandResult(
             text=f"<b>PRD still has errors</b>\n\n"
             f"{errors_text}\n\n"
@@ -555,22 +560,26 @@ async def handle_prd_show(
         )
 
 
+# prd subcommand name -> handler, each called as handler(ctx, ralph_ctx)
+PRD_SUBCOMMAND_HANDLERS: dict[
+    str, Callable[[CommandContext, RalphContext], Awaitable[CommandResult | None]]
+] = {
+    "init": handle_prd_init,
+    "clarify": handle_prd_clarify,
+    "fix": handle_prd_fix,
+    "show": handle_prd_show,
+}
+
+
 def _extract_project_name(description: str) -> str:
     """Extract project name from description.
 
     Looks for patterns like 'building a X', 'create a X', etc.
     Falls back to first few words.
     """
-    import re
-
     # Try common patterns
-    patterns = [
-        r"(?:building|create|develop|make|implement)\s+(?:a|an|the)?\s*([A-Za-z0-9\s]+?)(?:\.|,|that|which|with|for)",
-        r"^(?:a|an|the)?\s*([A-Za-z0-9\s]+?)(?:\.|,|that|which|with|for|-)",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, description, re.IGNORECASE)
+    for pattern in _PROJECT_NAME_PATTERNS:
+        match = pattern.search(description)
         if match:
             name = match.group(1).strip()
             if len(name) > 3 and len(name) < 50:
@@ -590,27 +599,33 @@ def _get_sessions_file(cwd: Path) -> Path:
 
 
 def _create_prd_init_session(cwd: Path) -> None:
-    """Create a pending prd init session."""
+    """Create a pending prd init session.
+
+    Written to a temp file and renamed into place, so a concurrent
+    has_pending_prd_init_session never reads a half-written file.
+    """
     sessions_file = _get_sessions_file(cwd)
     sessions_file.parent.mkdir(parents=True, exist_ok=True)
-    sessions_file.write_text(json.dumps({"pending": True}))
+    fd, tmp_path = tempfile.mkstemp(dir=sessions_file.parent, suffix=".tmp")
+    try:
+        with open(fd, "wb") as f:
+            f.write(_PENDING_SESSION)
+        Path(tmp_path).replace(sessions_file)
+    except Exception:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
 
 
 def _delete_prd_init_session(cwd: Path) -> None:
     """Delete the pending prd init session."""
-    sessions_file = _get_sessions_file(cwd)
-    if sessions_file.exists():
-        sessions_file.unlink()
+    _get_sessions_file(cwd).unlink(missing_ok=True)
 
 
 def has_pending_prd_init_session(cwd: Path) -> bool:
     """Check if there's a pending prd init session waiting for input."""
-    sessions_file = _get_sessions_file(cwd)
-    if not sessions_file.exists():
-        return False
-
     try:
-        data = json.loads(sessions_file.read_text())
+        data = from_json(_get_sessions_file(cwd).read_bytes())
         return data.get("pending", False)
-    except (json.JSONDecodeError, OSError):
+    except (ValueError, OSError):
+        # Also covers FileNotFoundError when there is no session
         return False
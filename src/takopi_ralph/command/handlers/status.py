@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from html import escape
+
 from takopi.api import CommandContext, CommandResult
 
 from ...circuit_breaker import CircuitBreaker
@@ -53,42 +55,42 @@ async def handle_status(
     # PRD info first - most important context
     lines.append("")
     lines.append("<b>PRD</b>")
+    prd = None
     if prd_manager.exists():
         # Validate PRD first to catch issues
-        is_valid, errors = prd_manager.validate()
-        if not is_valid:
+        prd, errors = prd_manager.load_validated()
+        if prd is None:
             lines.append("⚠️ <b>PRD has validation errors:</b>")
             for err in errors[:3]:
-                lines.append(f"  • {err}")
+                lines.append(f"  • {escape(err)}")
             if len(errors) > 3:
                 lines.append(f"  • ... and {len(errors) - 3} more")
             lines.append("")
             lines.append("Run <code>/ralph prd fix</code> to auto-fix schema issues.")
             # Still try to load what we can
-            prd = prd_manager.load()
-            if prd.project_name:
+            partial_prd = prd_manager.load()
+            if partial_prd.project_name:
                 lines.append("")
-                lines.append(f"<b>Project:</b> {prd.project_name} (may be incomplete)")
+                lines.append(f"<b>Project:</b> {partial_prd.project_name} (may be incomplete)")
         else:
-            prd = prd_manager.load()
             lines.append(f"<b>Project:</b> {prd.project_name or '(unnamed)'}")
             lines.append(f"<b>Quality:</b> {prd.quality_level}")
             lines.append(f"<b>Progress:</b> {prd.progress_summary()}")
 
-        # Current/next task
-        next_story = prd.next_story()
-        if next_story:
-            lines.append("")
-            lines.append(f"<b>Next task:</b> #{next_story.id} {next_story.title}")
-            if next_story.description:
-                # Truncate long descriptions
-                desc = next_story.description[:100]
-                if len(next_story.description) > 100:
-                    desc += "..."
-                lines.append(f"  {desc}")
-        elif prd.all_complete():
-            lines.append("")
-            lines.append("<b>All stories complete!</b>")
+            # Current/next task
+            next_story = prd.next_story()
+            if next_story:
+                lines.append("")
+                lines.append(f"<b>Next task:</b> #{next_story.id} {next_story.title}")
+                if next_story.description:
+                    # Truncate long descriptions
+                    desc = next_story.description[:100]
+                    if len(next_story.description) > 100:
+                        desc += "..."
+                    lines.append(f"  {desc}")
+            elif prd.all_complete():
+                lines.append("")
+                lines.append("<b>All stories complete!</b>")
     else:
         lines.append("<i>No prd.json found — run <code>/ralph prd init</code> to create</i>")
 
@@ -156,8 +158,7 @@ async def handle_status(
     lines.append(f"<b>Error loops:</b> {cb_status.get('consecutive_same_error', 0)}")
 
     # Pending stories list
-    if prd_manager.exists():
-        prd = prd_manager.load()
+    if prd is not None:
         pending = [s for s in prd.stories if not s.passes]
         if pending and len(pending) > 1:
             lines.append("")
@@ -9,6 +9,9 @@ from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
 
+# Sessions file inside the state directory
+INIT_SESSIONS_FILE = "init_sessions.json"
+
 
 class InitPhase(str, Enum):
     """Phase of the init flow."""
@@ -44,7 +47,7 @@ class InitFlow:
 
     def __init__(self, state_dir: Path | str = ".ralph"):
         self.state_dir = Path(state_dir)
-        self.sessions_file = self.state_dir / "init_sessions.json"
+        self.sessions_file = self.state_dir / INIT_SESSIONS_FILE
 
     def _ensure_dir(self) -> None:
         """Ensure state directory exists."""
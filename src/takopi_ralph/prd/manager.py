@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import tempfile
 from pathlib import Path
 
 from pydantic import ValidationError
+from pydantic_core import from_json
 
 from .schema import PRD, UserStory
 
@@ -38,16 +38,28 @@ class PRDManager:
         Returns:
             (is_valid, errors) tuple. errors is empty if valid.
         """
+        prd, errors = self.load_validated()
+        return prd is not None, errors
+
+    def load_validated(self) -> tuple[PRD | None, list[str]]:
+        """Validate and load the PRD from a single read of the file.
+
+        Use this instead of validate() followed by load(), which reads,
+        parses and validates the file twice.
+
+        Returns:
+            (prd, errors) tuple. prd is None and errors is non-empty if the
+            file is missing or invalid.
+        """
         if not self.exists():
-            return False, ["prd.json does not exist"]
+            return None, ["prd.json does not exist"]
 
         try:
-            content = self.prd_path.read_text()
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
-            return False, [f"Invalid JSON: {e}"]
+            data = from_json(self.prd_path.read_bytes())
+        except ValueError as e:
+            return None, [f"Invalid JSON: {e}"]
         except OSError as e:
-            return False, [f"Cannot read file: {e}"]
+            return None, [f"Cannot read file: {e}"]
 
         # Check for common wrong schema patterns
         errors = []
@@ -59,14 +71,15 @@ class PRDManager:
             errors.append("Found 'tasks' but expected 'stories'")
 
         # Try Pydantic validation
+        prd = None
         try:
-            PRD.model_validate(data)
+            prd = PRD.model_validate(data)
         except ValidationError as e:
             for err in e.errors():
                 loc = ".".join(str(x) for x in err["loc"])
                 errors.append(f"{loc}: {err['msg']}")
 
-        return len(errors) == 0, errors
+        return (None, errors) if errors else (prd, errors)
 
     def load(self) -> PRD:
         """Load PRD from file. Creates empty PRD if file doesn't exist or corrupted.
@@ -79,12 +92,8 @@ class PRDManager:
             return PRD(project_name="", description="")
 
         try:
-            content = self.prd_path.read_text()
-            data = json.loads(content)
+            data = from_json(self.prd_path.read_bytes())
             return PRD.model_validate(data)
-        except json.JSONDecodeError as e:
-            logger.warning("PRD file has invalid JSON: %s - %s", self.prd_path, e)
-            return PRD(project_name="", description="")
         except ValidationError as e:
             logger.warning(
                 "PRD file failed schema validation: %s - %d errors",
@@ -92,6 +101,10 @@ class PRDManager:
                 len(e.errors()),
             )
             return PRD(project_name="", description="")
+        except ValueError as e:
+            # from_json raises a plain ValueError for malformed JSON
+            logger.warning("PRD file has invalid JSON: %s - %s", self.prd_path, e)
+            return PRD(project_name="", description="")
         except OSError as e:
             logger.warning("Cannot read PRD file: %s - %s", self.prd_path, e)
             return PRD(project_name="", description="")
@@ -101,13 +114,13 @@ class PRDManager:
         if not self.exists():
             raise PRDValidationError("prd.json does not exist")
 
-        is_valid, errors = self.validate()
-        if not is_valid:
+        prd, errors = self.load_validated()
+        if prd is None:
             raise PRDValidationError(
                 f"PRD validation failed with {len(errors)} error(s)", errors
             )
 
-        return self.load()
+        return prd
 
     def save(self, prd: PRD) -> None:
         """Save PRD to file atomically."""
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 # Default feedback commands for common project types
 DEFAULT_FEEDBACK_COMMANDS: dict[str, str] = {
@@ -48,6 +48,9 @@ class PRD(BaseModel):
         default_factory=lambda: DEFAULT_FEEDBACK_COMMANDS.copy()
     )
 
+    # Next story ID, seeded from the existing stories on first add_story()
+    _next_id: int | None = PrivateAttr(default=None)
+
     def next_story(self) -> UserStory | None:
         """Return highest priority story where passes=False."""
         pending = [s for s in self.stories if not s.passes]
@@ -79,7 +82,10 @@ class PRD(BaseModel):
         priority: int | None = None,
     ) -> UserStory:
         """Add a new story to the PRD."""
-        story_id = max((s.id for s in self.stories), default=0) + 1
+        if self._next_id is None:
+            self._next_id = max((s.id for s in self.stories), default=0) + 1
+        story_id = self._next_id
+        self._next_id += 1
         story_priority = priority if priority is not None else story_id
 
         story = UserStory(
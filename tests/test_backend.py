@@ -0,0 +1,123 @@
+"""Tests for the /ralph command backend."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+from takopi_ralph.command.backend import (
+    RALPH_COMMANDS,
+    SUBCOMMAND_HANDLERS,
+    TOPIC_STATE_FILENAME,
+    _normalize_project_aliases,
+    _parse_project_branch,
+    _read_topic_context,
+    _session_files_present,
+)
+
+ALIASES = frozenset({"myproj", "other"})
+
+
+class TestParseProjectBranch:
+    """Tests for project/@branch argument parsing."""
+
+    def test_no_context(self):
+        """Should pass args through when no project or branch is given."""
+        assert _parse_project_branch(("ralph", "start"), ALIASES) == (None, None, ("start",))
+
+    def test_project_and_branch(self):
+        """Should consume a known project and an @branch."""
+        result = _parse_project_branch(("ralph", "myproj", "@feat", "prd", "clarify"), ALIASES)
+
+        assert result == ("myproj", "feat", ("prd", "clarify"))
+
+    def test_without_ralph_prefix(self):
+        """Should parse args that do not start with 'ralph'."""
+        assert _parse_project_branch(("@feat", "status"), ALIASES) == (None, "feat", ("status",))
+
+    def test_command_named_like_project(self):
+        """Should not treat a command as a project alias."""
+        result = _parse_project_branch(("ralph", "start"), ALIASES | {"start"})
+
+        assert result == (None, None, ("start",))
+
+    def test_stops_once_both_found(self):
+        """Should leave tokens after project and branch as arguments."""
+        result = _parse_project_branch(("myproj", "@feat", "other", "prd"), ALIASES)
+
+        assert result == ("myproj", "feat", ("other", "prd"))
+
+    def test_mixed_case_alias(self):
+        """Should match aliases configured with capitals."""
+        aliases = _normalize_project_aliases(("MyProj",))
+
+        assert _parse_project_branch(("myproj", "start"), aliases) == ("myproj", None, ("start",))
+
+
+class TestReadTopicContext:
+    """Tests for resolving context from takopi's topic state."""
+
+    def _write_state(self, temp_dir, context):
+        state = {"threads": {"1:2": {"context": context}}}
+        (temp_dir / TOPIC_STATE_FILENAME).write_text(json.dumps(state))
+
+    def test_reads_thread_context(self, temp_dir):
+        """Should return the project and branch bound to the thread."""
+        self._write_state(temp_dir, {"project": "myproj", "branch": "feat"})
+
+        ctx = _read_topic_context(temp_dir / "takopi.toml", 1, 2)
+
+        assert (ctx.project, ctx.branch) == ("myproj", "feat")
+
+    def test_picks_up_state_changes(self, temp_dir):
+        """Should reread the state file after it is rewritten."""
+        self._write_state(temp_dir, {"project": "myproj"})
+        assert _read_topic_context(temp_dir / "takopi.toml", 1, 2).project == "myproj"
+
+        self._write_state(temp_dir, {"project": "otherproject"})
+
+        assert _read_topic_context(temp_dir / "takopi.toml", 1, 2).project == "otherproject"
+
+    def test_missing_state_file(self, temp_dir):
+        """Should return None when takopi has no topic state."""
+        assert _read_topic_context(temp_dir / "takopi.toml", 1, 2) is None
+
+
+class TestSessionFilesPresent:
+    """Tests for the pending session file scan."""
+
+    def test_no_state_dir(self, temp_dir):
+        """Should report nothing when .ralph/ does not exist."""
+        assert _session_files_present(temp_dir) == frozenset()
+
+    def test_reports_session_files_only(self, temp_dir):
+        """Should list session files and ignore other state files."""
+        ralph_dir = temp_dir / ".ralph"
+        ralph_dir.mkdir()
+        (ralph_dir / "init_sessions.json").write_text("{}")
+        (ralph_dir / "clarify_session.json").write_text("{}")
+        (ralph_dir / "state.json").write_text("{}")
+
+        assert _session_files_present(temp_dir) == {"init_sessions.json", "clarify_session.json"}
+
+
+class TestSubcommandHandlers:
+    """Tests for the subcommand routing table."""
+
+    def test_every_command_has_handler(self):
+        """Should route every reserved command name."""
+        assert set(SUBCOMMAND_HANDLERS) == RALPH_COMMANDS
+
+    def test_handlers_not_imported_eagerly(self):
+        """Should not load handler modules when the backend is imported."""
+        code = (
+            "import sys, takopi_ralph.command.backend; "
+            "print(any(m.startswith('takopi_ralph.command.handlers.') "
+            "and m != 'takopi_ralph.command.handlers.constants' for m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
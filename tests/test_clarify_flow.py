@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 from takopi_ralph.clarify import ClarifyFlow, ClarifySession
+from takopi_ralph.clarify.flow import _session_logs
 
 # Sample questions for testing (simulating LLM-generated questions)
 SAMPLE_QUESTIONS = [
@@ -122,6 +127,12 @@ class TestClarifySession:
 
         assert progress == "0/0"
 
+    def test_session_uses_slots(self):
+        """Should not carry a per-instance __dict__."""
+        session = ClarifySession(topic="Test")
+
+        assert not hasattr(session, "__dict__")
+
     def test_has_questions(self):
         """Should check if questions exist."""
         empty_session = ClarifySession(topic="Test")
@@ -147,6 +158,7 @@ class TestClarifyFlow:
         assert retrieved is not None
         assert retrieved.id == session.id
         assert retrieved.topic == "Test Project"
+        assert retrieved.created_at_ns == session.created_at_ns
 
     def test_create_session_with_questions(self, temp_dir):
         """Should create session with pending questions."""
@@ -161,6 +173,21 @@ class TestClarifyFlow:
         assert retrieved is not None
         assert len(retrieved.pending_questions) == 3
 
+    def test_create_session_with_initial_answers(self, temp_dir):
+        """Should persist initial answers with the new session."""
+        flow = ClarifyFlow(temp_dir)
+
+        session = flow.create_session(
+            topic="Test",
+            pending_questions=SAMPLE_QUESTIONS,
+            initial_answers={"_description": "A test project"},
+        )
+        retrieved = ClarifyFlow(temp_dir).get_session(session.id)
+
+        assert retrieved is not None
+        assert retrieved.answers == {"_description": "A test project"}
+        assert (temp_dir / "clarify_sessions.jsonl").read_text().count("\n") == 1
+
     def test_update_session(self, temp_dir):
         """Should persist session updates."""
         flow = ClarifyFlow(temp_dir)
@@ -197,3 +224,136 @@ class TestClarifyFlow:
 
         assert session.mode == "enhance"
         assert session.focus == "testing"
+
+    def test_sessions_survive_new_flow_instance(self, temp_dir):
+        """Should replay the session log in a fresh flow."""
+        flow = ClarifyFlow(temp_dir)
+
+        kept = flow.create_session("Kept", pending_questions=SAMPLE_QUESTIONS)
+        kept.record_answer("MVP")
+        flow.update_session(kept)
+        dropped = flow.create_session("Dropped")
+        flow.delete_session(dropped.id)
+
+        reloaded = ClarifyFlow(temp_dir)
+        retrieved = reloaded.get_session(kept.id)
+
+        assert retrieved is not None
+        assert retrieved.current_question_index == 1
+        assert reloaded.get_session(dropped.id) is None
+
+    def test_session_log_is_compacted(self, temp_dir):
+        """Should keep the log bounded by compacting dead records."""
+        flow = ClarifyFlow(temp_dir)
+
+        session = flow.create_session("Test", pending_questions=SAMPLE_QUESTIONS)
+        for _ in range(10):
+            session.skip_question()
+            flow.update_session(session)
+
+        lines = flow.sessions_file.read_text().splitlines()
+        assert len(lines) <= 2
+        assert ClarifyFlow(temp_dir).get_session(session.id) is not None
+
+    def test_session_log_ignores_torn_record(self, temp_dir):
+        """Should skip a partially written trailing record."""
+        flow = ClarifyFlow(temp_dir)
+        session = flow.create_session("Test")
+
+        with flow.sessions_file.open("a") as f:
+            f.write('{"op": "put", "id": "tor')
+
+        assert ClarifyFlow(temp_dir).get_session(session.id) is not None
+
+    def test_append_after_torn_record_is_kept(self, temp_dir):
+        """Should start a new line rather than extend a torn record."""
+        flow = ClarifyFlow(temp_dir)
+        kept = flow.create_session("A")
+        with flow.sessions_file.open("a") as f:
+            f.write('{"op": "put", "id": "tor')
+
+        # Simulate a restart so the torn tail is found by a fresh replay
+        _session_logs.clear()
+        added = ClarifyFlow(temp_dir).create_session("B")
+        _session_logs.clear()
+
+        reloaded = ClarifyFlow(temp_dir)
+        assert reloaded.get_session(kept.id) is not None
+        assert reloaded.get_session(added.id) is not None
+
+    def test_migrates_legacy_sessions_file(self, temp_dir):
+        """Should carry sessions over from the old single-JSON store."""
+        legacy = {
+            "abc12345": {
+                "id": "abc12345",
+                "topic": "Old",
+                "created_at": "2025-01-02T03:04:05+00:00",
+                "mode": "create",
+                "focus": None,
+                "pending_questions": SAMPLE_QUESTIONS,
+                "current_question_index": 1,
+                "answers": {"What is the primary goal?": "MVP"},
+                "is_complete": False,
+            }
+        }
+        (temp_dir / "clarify_sessions.json").write_text(json.dumps(legacy))
+
+        session = ClarifyFlow(temp_dir).get_session("abc12345")
+
+        assert session is not None
+        assert session.current_question_index == 1
+        assert session.created_at.year == 2025
+        assert not (temp_dir / "clarify_sessions.json").exists()
+        assert ClarifyFlow(temp_dir).get_session("abc12345") is not None
+
+    def test_concurrent_sessions_from_threads(self, temp_dir):
+        """Should keep the shared index consistent across worker threads."""
+        # Large questions so compaction spends a while walking the index
+        questions = [{"question": f"Q{i} " * 50, "options": ["A" * 200] * 5} for i in range(10)]
+
+        def churn(n: int) -> list[str]:
+            flow = ClarifyFlow(temp_dir)
+            live = []
+            for i in range(60):
+                session = flow.create_session(f"Thread {n}", pending_questions=questions)
+                live.append(session.id)
+                if i % 2:
+                    flow.delete_session(live.pop(0))
+                session.skip_question()
+                flow.update_session(session)
+            return live
+
+        # Switch threads often so unguarded index access would interleave
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                live_ids = [sid for ids in pool.map(churn, range(8)) for sid in ids]
+        finally:
+            sys.setswitchinterval(interval)
+
+        _session_logs.clear()
+        reloaded = ClarifyFlow(temp_dir)
+        assert all(reloaded.get_session(sid) is not None for sid in live_ids)
+
+    def test_sessions_reload_after_external_change(self, temp_dir):
+        """Should notice when the log is replaced behind the index's back."""
+        flow = ClarifyFlow(temp_dir)
+        session = flow.create_session("Test")
+        assert flow.get_session(session.id) is not None
+
+        flow.sessions_file.unlink()
+
+        assert flow.get_session(session.id) is None
+
+    def test_sessions_shared_between_instances(self, temp_dir):
+        """Should see updates made through another instance."""
+        first = ClarifyFlow(temp_dir)
+        second = ClarifyFlow(temp_dir)
+        session = first.create_session("Test", pending_questions=SAMPLE_QUESTIONS)
+        assert second.get_session(session.id) is not None
+
+        session.record_answer("Yes")
+        first.update_session(session)
+
+        assert second.get_session(session.id).current_question_index == 1
@@ -0,0 +1,101 @@
+"""Tests for clarify handler session tracking."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from takopi_ralph.clarify import ClarifySession
+from takopi_ralph.command.handlers.clarify import (
+    CLARIFY_CALLBACK_PREFIX,
+    CLARIFY_SESSION_FILE,
+    _build_keyboard,
+    _clear_active_session,
+    _get_active_session_id,
+    _save_active_session,
+    has_active_clarify_session,
+    send_question,
+)
+
+
+class TestActiveSession:
+    """Tests for the active clarify session file."""
+
+    def test_save_and_get(self, temp_dir):
+        """Should return the saved session ID."""
+        _save_active_session(temp_dir, "abc123")
+
+        assert _get_active_session_id(temp_dir) == "abc123"
+        assert has_active_clarify_session(temp_dir)
+
+    def test_no_session(self, temp_dir):
+        """Should report no session when nothing was saved."""
+        assert _get_active_session_id(temp_dir) is None
+        assert not has_active_clarify_session(temp_dir)
+
+    def test_clear(self, temp_dir):
+        """Should forget the session once cleared."""
+        _save_active_session(temp_dir, "abc123")
+        _clear_active_session(temp_dir)
+
+        assert not has_active_clarify_session(temp_dir)
+        _clear_active_session(temp_dir)
+
+    def test_external_rewrite(self, temp_dir):
+        """Should notice a session file written by another process."""
+        _save_active_session(temp_dir, "abc123")
+        assert _get_active_session_id(temp_dir) == "abc123"
+
+        session_file = temp_dir / ".ralph" / CLARIFY_SESSION_FILE
+        session_file.write_text(json.dumps({"session_id": "other-session"}))
+
+        assert _get_active_session_id(temp_dir) == "other-session"
+
+
+class TestBuildKeyboard:
+    """Tests for the clarify inline keyboard."""
+
+    def test_buttons(self):
+        """Should add one numbered row per option plus a skip row."""
+        keyboard = _build_keyboard("sid", ["Yes", "x" * 50])
+
+        rows = keyboard["inline_keyboard"]
+        assert [row[0]["callback_data"] for row in rows] == [
+            f"{CLARIFY_CALLBACK_PREFIX}sid:0",
+            f"{CLARIFY_CALLBACK_PREFIX}sid:1",
+            f"{CLARIFY_CALLBACK_PREFIX}sid:skip",
+        ]
+        assert rows[0][0]["text"] == "1. Yes"
+        assert rows[1][0]["text"] == "2. " + "x" * 37 + "..."
+
+
+class FakeSender:
+    """Executor stand-in that records sent messages."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, message, **kwargs):
+        self.sent.append(message)
+
+
+@pytest.mark.anyio
+class TestSendQuestion:
+    """Tests for sending a clarify question."""
+
+    async def test_intro_shares_message(self, temp_dir):
+        """Should send the intro and the question as one message."""
+        session = ClarifySession(
+            topic="Test",
+            pending_questions=[{"question": "Which language?", "options": ["Python"]}],
+        )
+        ctx = SimpleNamespace(executor=FakeSender())
+
+        await send_question(ctx, session, temp_dir, intro="I have 1 questions.")
+
+        assert len(ctx.executor.sent) == 1
+        text = ctx.executor.sent[0].text
+        assert text.startswith("I have 1 questions.\n\n<b>[1/1] Which language?</b>")
+        assert _get_active_session_id(temp_dir) == session.id
@@ -0,0 +1,73 @@
+"""Tests for the init handler."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from takopi_ralph.command.context import RalphContext
+from takopi_ralph.command.handlers.init import _probe_project, handle_init_topic_input
+from takopi_ralph.init import InitFlow
+from takopi_ralph.state import StateManager
+
+
+class TestProbeProject:
+    """Tests for the PRD and loop state probe."""
+
+    def test_empty_project(self, temp_dir):
+        """Should report nothing for a fresh directory."""
+        assert _probe_project(temp_dir) == (None, [], False)
+
+    def test_valid_prd(self, temp_dir, sample_prd_data):
+        """Should load a valid PRD."""
+        (temp_dir / "prd.json").write_text(json.dumps(sample_prd_data))
+
+        prd, errors, loop_running = _probe_project(temp_dir)
+
+        assert prd is not None
+        assert prd.project_name == "Test Project"
+        assert errors == []
+        assert not loop_running
+
+    def test_invalid_prd(self, temp_dir):
+        """Should report validation errors without loading the PRD."""
+        (temp_dir / "prd.json").write_text(json.dumps({"name": "x", "tasks": []}))
+
+        prd, errors, _ = _probe_project(temp_dir)
+
+        assert prd is None
+        assert errors
+
+    def test_running_loop(self, temp_dir):
+        """Should report a running loop when there is no PRD."""
+        StateManager(temp_dir / ".ralph").start_session("Test Project")
+
+        assert _probe_project(temp_dir) == (None, [], True)
+
+
+class FailingEngine:
+    """Executor stand-in whose engine run fails."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, message, **kwargs):
+        self.sent.append(message)
+
+    async def run_one(self, request, mode="emit"):
+        raise RuntimeError("engine unavailable")
+
+
+@pytest.mark.anyio
+class TestHandleInitTopicInput:
+    """Tests for the init topic step."""
+
+    async def test_analysis_error_is_not_grouped(self, temp_dir):
+        """Should raise the analysis error itself, not a task group wrapper."""
+        InitFlow(temp_dir / ".ralph").create_session()
+        ctx = SimpleNamespace(executor=FailingEngine())
+
+        with pytest.raises(RuntimeError, match="engine unavailable"):
+            await handle_init_topic_input(ctx, "Task app", RalphContext(None, temp_dir))
@@ -0,0 +1,93 @@
+"""Tests for PRD models and file management."""
+
+from __future__ import annotations
+
+import json
+
+from takopi_ralph.prd import PRD, PRDManager
+
+
+class TestAddStory:
+    """Tests for adding stories to a PRD."""
+
+    def test_ids_continue_after_loaded_stories(self, sample_prd_data):
+        """Should number new stories after the highest existing ID."""
+        prd = PRD.model_validate(sample_prd_data)
+
+        first = prd.add_story(title="Third", description="")
+        second = prd.add_story(title="Fourth", description="")
+
+        assert (first.id, second.id) == (3, 4)
+        assert second.priority == 4
+
+    def test_ids_start_at_one(self):
+        """Should start numbering at 1 for an empty PRD."""
+        prd = PRD(project_name="Test", description="")
+
+        assert prd.add_story(title="First", description="", priority=5).id == 1
+        assert prd.add_story(title="Second", description="").id == 2
+
+    def test_copy_keeps_counter(self, sample_prd_data):
+        """Should not reuse IDs on a copied PRD."""
+        prd = PRD.model_validate(sample_prd_data)
+        prd.add_story(title="Third", description="")
+
+        copy = prd.model_copy(deep=True)
+
+        assert copy.add_story(title="Fourth", description="").id == 4
+
+
+class TestLoadValidated:
+    """Tests for loading and validating prd.json in one pass."""
+
+    def test_valid(self, temp_dir, sample_prd_data):
+        """Should return the loaded PRD and no errors."""
+        (temp_dir / "prd.json").write_text(json.dumps(sample_prd_data))
+        manager = PRDManager(temp_dir / "prd.json")
+
+        prd, errors = manager.load_validated()
+
+        assert errors == []
+        assert prd is not None
+        assert [s.id for s in prd.stories] == [1, 2]
+        assert manager.validate() == (True, [])
+
+    def test_wrong_schema(self, temp_dir):
+        """Should report schema errors without a PRD."""
+        (temp_dir / "prd.json").write_text(json.dumps({"name": "x", "tasks": []}))
+        manager = PRDManager(temp_dir / "prd.json")
+
+        prd, errors = manager.load_validated()
+
+        assert prd is None
+        assert "Found 'name' but expected 'project_name'" in errors
+        assert manager.validate() == (False, errors)
+
+    def test_legacy_field_alongside_schema(self, temp_dir, sample_prd_data):
+        """Should reject a PRD that still carries legacy fields."""
+        sample_prd_data.pop("stories")
+        sample_prd_data["tasks"] = []
+        (temp_dir / "prd.json").write_text(json.dumps(sample_prd_data))
+
+        prd, errors = PRDManager(temp_dir / "prd.json").load_validated()
+
+        assert prd is None
+        assert errors == ["Found 'tasks' but expected 'stories'"]
+
+    def test_invalid_json(self, temp_dir):
+        """Should report malformed JSON, and load() should fall back to an empty PRD."""
+        (temp_dir / "prd.json").write_text("{not json")
+        manager = PRDManager(temp_dir / "prd.json")
+
+        prd, errors = manager.load_validated()
+
+        assert prd is None
+        assert errors[0].startswith("Invalid JSON:")
+        assert manager.load().project_name == ""
+
+    def test_missing(self, temp_dir):
+        """Should report a missing file."""
+        assert PRDManager(temp_dir / "prd.json").load_validated() == (
+            None,
+            ["prd.json does not exist"],
+        )
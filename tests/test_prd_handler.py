@@ -0,0 +1,89 @@
+"""Tests for the prd handler."""
+
+from __future__ import annotations
+
+from takopi_ralph.command.handlers.prd import (
+    PRD_INIT_SESSIONS_FILE,
+    PRD_SUBCOMMAND_HANDLERS,
+    _create_prd_init_session,
+    _delete_prd_init_session,
+    _format_prd_status,
+    has_pending_prd_init_session,
+)
+from takopi_ralph.prd import PRD
+
+
+class TestPrdInitSession:
+    """Tests for the pending prd init session file."""
+
+    def test_create_and_check(self, temp_dir):
+        """Should report a pending session once created."""
+        _create_prd_init_session(temp_dir)
+
+        assert has_pending_prd_init_session(temp_dir)
+        assert [p.name for p in (temp_dir / ".ralph").iterdir()] == [PRD_INIT_SESSIONS_FILE]
+
+    def test_no_session(self, temp_dir):
+        """Should report no session when nothing was created."""
+        assert not has_pending_prd_init_session(temp_dir)
+
+    def test_delete(self, temp_dir):
+        """Should forget the session once deleted."""
+        _create_prd_init_session(temp_dir)
+        _delete_prd_init_session(temp_dir)
+
+        assert not has_pending_prd_init_session(temp_dir)
+        _delete_prd_init_session(temp_dir)
+
+    def test_corrupt_file(self, temp_dir):
+        """Should treat an unreadable session file as no session."""
+        sessions_file = temp_dir / ".ralph" / PRD_INIT_SESSIONS_FILE
+        sessions_file.parent.mkdir(parents=True)
+        sessions_file.write_text("{not json")
+
+        assert not has_pending_prd_init_session(temp_dir)
+
+
+class TestFormatPrdStatus:
+    """Tests for the PRD status display."""
+
+    def test_progress_and_next(self, sample_prd_data):
+        """Should count completed stories and pick the same next story as the PRD."""
+        sample_prd_data["stories"][0]["passes"] = True
+        sample_prd_data["stories"].append(
+            {
+                "id": 3,
+                "title": "Urgent fix",
+                "description": "",
+                "acceptance_criteria": [],
+                "passes": False,
+                "priority": 1,
+            }
+        )
+        prd = PRD.model_validate(sample_prd_data)
+
+        text = _format_prd_status(prd)
+
+        assert "<b>Progress:</b> 1/3 stories complete" in text
+        assert "  ✓ 1. Setup project" in text
+        assert "  ○ 2. Add feature" in text
+        assert text.endswith(f"<b>Next:</b> {prd.next_story().title}")
+        assert prd.next_story().title == "Urgent fix"
+
+    def test_all_complete(self, sample_prd_data):
+        """Should omit the next story hint when everything passes."""
+        for story in sample_prd_data["stories"]:
+            story["passes"] = True
+
+        text = _format_prd_status(PRD.model_validate(sample_prd_data))
+
+        assert "2/2 stories complete" in text
+        assert "<b>Next:</b>" not in text
+
+
+class TestPrdSubcommandHandlers:
+    """Tests for the prd subcommand routing table."""
+
+    def test_subcommands(self):
+        """Should route every documented prd subcommand."""
+        assert set(PRD_SUBCOMMAND_HANDLERS) == {"init", "clarify", "fix", "show"}